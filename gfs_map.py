@@ -0,0 +1,302 @@
+import glob
+import hashlib
+import io
+import os
+import tempfile
+import numpy as np
+import streamlit as st
+import xarray as xr
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from matplotlib.ticker import MaxNLocator
+import cartopy.crs as ccrs
+import cartopy.feature as cfeature
+import shapely.geometry as sgeom
+import pandas as pd
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+# === Wilayah peta ===
+REGIONS = {
+    "Kaltara": dict(
+        name="Kalimantan Utara",
+        title="📍 Prakiraan Cuaca Provinsi Kalimantan Utara",
+        lat=(2.0, 5.0),
+        lon=(114.0, 118.2),
+        # Titik koordinat BMKG se-Kaltara
+        stations={
+            "BMKG Long Bawan": (3.6888, 115.7372),
+            "BMKG Nunukan": (4.1364, 117.6608),
+            "BMKG Malinau": (3.5917, 116.6203),
+            "BMKG Tarakan": (3.3264, 117.5673),
+            "BMKG Tanjung Selor": (2.8372, 117.3741),
+        },
+    ),
+}
+
+# === Fungsi bantu ambil waktu GFS terbaru ===
+# Hasil sama selama satu jam UTC, jadi cukup dihitung sekali per jam
+@lru_cache(maxsize=4)
+def _gfs_for(hour_bucket):
+    now = datetime.strptime(hour_bucket, '%Y%m%d%H')
+    gfs_date = now.strftime('%Y%m%d')
+    gfs_hour = ["00", "06", "12", "18"][now.hour // 6]
+    return gfs_date, gfs_hour
+
+def get_latest_gfs_time():
+    return _gfs_for((datetime.utcnow() - timedelta(hours=6)).strftime('%Y%m%d%H'))
+
+# Cache subdomain GFS di disk agar restart server tidak perlu ke NOMADS lagi
+CACHE_DIR = "/tmp/gfs_cache"
+GFS_VARS = ["pratesfc", "tmp2m", "ugrd10m", "vgrd10m", "prmslmsl"]
+# Masuk ke nama file agar cache lama tak dipakai bila daftar variabel berubah
+VARS_TAG = hashlib.sha1(",".join(GFS_VARS).encode()).hexdigest()[:8]
+
+# Hapus file cache run lama / daftar variabel lama agar /tmp tidak terus bertambah
+def prune_cache(run_date, run_hour):
+    run_prefix = f"gfs_{run_date}_{run_hour}z_"
+    for old in glob.glob(os.path.join(CACHE_DIR, "gfs_*.nc")):
+        name = os.path.basename(old)
+        if not (name.startswith(run_prefix) and name.endswith(f"_{VARS_TAG}.nc")):
+            try:
+                os.remove(old)
+            except FileNotFoundError:
+                pass
+
+@st.cache_resource(max_entries=4)
+def load_dataset(run_date, run_hour, bbox):
+    lat_min, lat_max, lon_min, lon_max = bbox
+    path = os.path.join(CACHE_DIR, f"gfs_{run_date}_{run_hour}z_{lat_min}_{lat_max}_{lon_min}_{lon_max}"
+                                   f"_{VARS_TAG}.nc")
+    if not os.path.exists(path):
+        url = f"https://nomads.ncep.noaa.gov/dods/gfs_0p25_1hr/gfs{run_date}/gfs_0p25_1hr_{run_hour}z"
+        # Client DAP bawaan libnetcdf (C), bukan pydap yang jauh lebih lambat
+        ds = xr.open_dataset(url, engine="netcdf4")
+        lat_slice = slice(lat_min, lat_max) if ds.lat[0] < ds.lat[-1] else slice(lat_max, lat_min)
+        sub = ds[GFS_VARS].sel(lat=lat_slice, lon=slice(lon_min, lon_max))
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # File sementara unik per penulis, aman bila beberapa proses mengisi cache bersamaan
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix="gfs_", suffix=".tmp")
+        os.close(fd)
+        try:
+            sub.to_netcdf(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        prune_cache(run_date, run_hour)
+    # Seluruh sumbu waktu subdomain dimuat ke memori; geser slider cukup indeks lokal
+    return xr.load_dataset(path, engine="netcdf4")
+
+# Indeks integer bbox (inklusif seperti .sel) dari sumbu 1D, untuk dipakai .isel
+def bbox_index(ds, lat_min, lat_max, lon_min, lon_max):
+    lats = ds.lat.values
+    lons = ds.lon.values
+    if lats[0] < lats[-1]:
+        i0, i1 = np.searchsorted(lats, lat_min, "left"), np.searchsorted(lats, lat_max, "right")
+    else:
+        i0, i1 = np.searchsorted(-lats, -lat_max, "left"), np.searchsorted(-lats, -lat_min, "right")
+    j0, j1 = np.searchsorted(lons, lon_min, "left"), np.searchsorted(lons, lon_max, "right")
+    return dict(lat=slice(i0, i1), lon=slice(j0, j1))
+
+# Ambil satu jam dari cache subdomain yang sudah di memori. Indeks wilayah hanya
+# pengaman bila bbox cache dan bbox wilayah suatu saat berbeda; kini selalu penuh.
+def get_subset(ds, name, t, index):
+    return ds[name].isel(time=t, **index)
+
+# Garis Natural Earth dibaca & dipotong ke bbox sekali per proses, disimpan sebagai array koordinat
+@st.cache_resource
+def get_ne_features(extent):
+    lon_min, lon_max, lat_min, lat_max = extent
+    box = sgeom.box(lon_min, lat_min, lon_max, lat_max)
+
+    def to_segments(feature):
+        segs = []
+        for geom in feature.intersecting_geometries(extent):
+            clipped = geom.intersection(box)
+            for line in getattr(clipped, "geoms", [clipped]):
+                if line.geom_type == "LineString" and not line.is_empty:
+                    segs.append(np.asarray(line.coords))
+        return segs
+
+    # Poligon daratan jadi satu Path majemuk (exterior + lubang), tanpa reproyeksi per draw
+    def to_path(feature):
+        rings = []
+        for geom in feature.intersecting_geometries(extent):
+            clipped = geom.intersection(box)
+            for poly in getattr(clipped, "geoms", [clipped]):
+                if poly.geom_type == "Polygon" and not poly.is_empty:
+                    for ring in [poly.exterior, *poly.interiors]:
+                        rings.append(Path(np.asarray(ring.coords), closed=True))
+        return Path.make_compound_path(*rings) if rings else None
+
+    return {
+        "coast": to_segments(cfeature.NaturalEarthFeature("physical", "coastline", "10m")),
+        "borders": to_segments(cfeature.BORDERS),
+        "rivers": to_segments(cfeature.RIVERS),
+        "land": to_path(cfeature.LAND),
+    }
+
+# Isobar tiap 2 hPa genap; bila < 2 level jatuh di rentang data, turun ke 1 hPa lalu MaxNLocator
+def isobar_levels(lo, hi):
+    for step in (2, 1):
+        levels = np.arange(step * np.floor(lo / step), step * np.ceil(hi / step) + step, step)
+        if ((levels >= lo) & (levels <= hi)).sum() >= 2:
+            return levels, "%d"
+    return MaxNLocator(nbins=6).tick_values(lo, hi), "%g"
+
+def f32(x):
+    return x.astype(np.float32, copy=False)
+
+def wind_speed_knots(u, v):
+    # hypot satu lintasan, konversi knot in-place tanpa array sementara
+    speed = np.hypot(f32(u), f32(v))
+    speed *= np.float32(1.94384)
+    return speed
+
+# === Parameter cuaca: (menu, label, cmap, konversi, vektor, kontur, (vmin, vmax, extend)) ===
+# Konversi satuan memakai skalar float32 agar array plot tetap float32;
+# rentang warna tetap agar colorbar tidak melompat antar jam, panah extend
+# menandai nilai di luar rentang. Tekanan hanya kontur, tanpa rentang warna.
+PARAMS = {
+    "pratesfc": ("Curah Hujan per jam (pratesfc)", "Curah Hujan (mm/jam)", "Blues",
+                 lambda x: f32(x) * np.float32(3600.0), False, False, (0, 30, 'max')),
+    "tmp2m": ("Suhu Permukaan (tmp2m)", "Suhu Permukaan (°C)", "coolwarm",
+              lambda x: f32(x) - np.float32(273.15), False, False, (18, 36, 'both')),
+    "ugrd10m": ("Angin Permukaan (ugrd10m & vgrd10m)", "Kecepatan Angin (knot)", "YlGnBu",
+                wind_speed_knots, True, False, (0, 40, 'max')),
+    "prmslmsl": ("Tekanan Permukaan Laut (prmslmsl)", "Tekanan Permukaan Laut (hPa)", "cool",
+                 lambda x: f32(x) * np.float32(0.01), False, True, None),
+}
+
+def main(region, author):
+    reg = REGIONS[region]
+    lat_min, lat_max = reg["lat"]
+    lon_min, lon_max = reg["lon"]
+    stations = reg["stations"]
+
+    # === Konfigurasi Streamlit ===
+    st.set_page_config(page_title=f"Prakiraan Cuaca {reg['name']}", layout="wide")
+    st.title(reg["title"])
+    st.markdown(f"**{author}**")
+
+    # === Sidebar kontrol ===
+    run_date, run_hour = get_latest_gfs_time()
+    st.sidebar.title("⚙️ Pengaturan")
+    st.sidebar.info(f"GFS Run: {run_date} jam {run_hour}Z")
+
+    forecast_hour = st.sidebar.slider("Jam ke depan", 0, 240, 6, step=3)
+    parameter = st.sidebar.selectbox("Parameter Cuaca", list(PARAMS),
+                                     format_func=lambda k: PARAMS[k][0])
+    use_pcolormesh = st.sidebar.checkbox("Tampilan grid akurat (pcolormesh)", value=False)
+
+    # === Load dataset GFS ===
+    try:
+        ds = load_dataset(run_date, run_hour, (lat_min, lat_max, lon_min, lon_max))
+        st.success("✅ Data GFS berhasil dimuat.")
+    except Exception as e:
+        st.error(f"❌ Gagal memuat data: {e}")
+        st.stop()
+
+    index = bbox_index(ds, lat_min, lat_max, lon_min, lon_max)
+
+    # === Parameter cuaca ===
+    _, label, cmap, convert, is_vector, is_contour, clim = PARAMS[parameter]
+    if is_vector:
+        sub = get_subset(ds, ["ugrd10m", "vgrd10m"], forecast_hour, index)
+        u = sub["ugrd10m"].values
+        v = sub["vgrd10m"].values
+        var = convert(u, v)
+    else:
+        sub = get_subset(ds, parameter, forecast_hour, index)
+        var = convert(sub.values)
+
+    var_lon, var_lat = sub.lon.values, sub.lat.values
+
+    # === Validasi waktu ===
+    valid_time = pd.to_datetime(str(ds.time[forecast_hour].values))
+    valid_str = valid_time.strftime("%HUTC %a %d %b %Y")
+    tstr = f"t+{forecast_hour:03d}"
+
+    # === Plot Peta ===
+    # Figure & peta dasar dibuat sekali per sesi & wilayah, rerun hanya mengganti artist data
+    fig_key = f"fig_{region}"
+    if fig_key not in st.session_state:
+        fig = Figure(figsize=(10, 6))
+        ax = fig.add_subplot(projection=ccrs.PlateCarree())
+        ax.set_autoscale_on(False)
+        ax.set_extent([lon_min, lon_max, lat_min, lat_max], crs=ccrs.PlateCarree())
+
+        # Tambahan fitur geospasial
+        ne = get_ne_features((lon_min, lon_max, lat_min, lat_max))
+        ax.set_facecolor(cfeature.COLORS['water'])
+        if ne["land"] is not None:
+            ax.add_patch(PathPatch(ne["land"], facecolor='lightgray', edgecolor='none',
+                                   transform=ccrs.PlateCarree(), zorder=-1))
+        ax.add_collection(LineCollection(ne["coast"], colors='black', linewidths=0.8,
+                                         transform=ccrs.PlateCarree(), zorder=1.5))
+        ax.add_collection(LineCollection(ne["borders"], colors='black', linestyles=':', linewidths=0.5,
+                                         transform=ccrs.PlateCarree(), zorder=1.5))
+        ax.add_collection(LineCollection(ne["rivers"], colors=cfeature.COLORS['water'], linewidths=0.5,
+                                         transform=ccrs.PlateCarree(), zorder=1.5))
+
+        # Plot semua stasiun BMKG
+        for name, (lat, lon) in stations.items():
+            ax.plot(lon, lat, marker='o', color='red', markersize=6, transform=ccrs.PlateCarree())
+            ax.text(lon + 0.03, lat, name, fontsize=7, transform=ccrs.PlateCarree(), color='red')
+
+        st.session_state[fig_key] = dict(fig=fig, ax=ax, artists=[])
+
+    state = st.session_state[fig_key]
+    fig, ax = state["fig"], state["ax"]
+    # Urutan terbalik: colorbar dilepas sebelum mappable-nya
+    for artist in reversed(state["artists"]):
+        artist.remove()
+    artists = state["artists"] = []
+
+    # Judul dan waktu validasi
+    artists.append(ax.text(0.5, 1.08, f"{label}", transform=ax.transAxes, ha="center",
+                           fontsize=12, fontweight="bold"))
+    artists.append(ax.text(0.01, 1.03, f"Valid: {valid_str}", transform=ax.transAxes,
+                           fontsize=9, ha="left", va="top"))
+    artists.append(ax.text(0.99, 1.03, f"GFS {run_date} {run_hour}Z {tstr}", transform=ax.transAxes,
+                           fontsize=9, ha="right", va="top"))
+
+    # Tampilkan data
+    if is_contour:
+        levels, fmt = isobar_levels(float(var.min()), float(var.max()))
+        cs = ax.contour(var_lon, var_lat, var, levels=levels, colors='black',
+                        linewidths=0.8, transform=ccrs.PlateCarree())
+        ax.clabel(cs, fmt=fmt, fontsize=8)
+        artists.append(cs)
+    else:
+        vmin, vmax, extend = clim
+        if use_pcolormesh:
+            im = ax.pcolormesh(var_lon, var_lat, var, shading='nearest',
+                               transform=ccrs.PlateCarree(), cmap=cmap, vmin=vmin, vmax=vmax)
+        else:
+            # Grid GFS reguler, imshow jauh lebih cepat dari pcolormesh
+            dlon, dlat = abs(var_lon[1] - var_lon[0]) / 2, abs(var_lat[1] - var_lat[0]) / 2
+            extent = [var_lon.min() - dlon, var_lon.max() + dlon,
+                      var_lat.min() - dlat, var_lat.max() + dlat]
+            im = ax.imshow(var, extent=extent, origin='upper' if var_lat[0] > var_lat[-1] else 'lower',
+                           cmap=cmap, vmin=vmin, vmax=vmax,
+                           transform=ccrs.PlateCarree(), interpolation='nearest')
+        cbar = fig.colorbar(im, ax=ax, orientation='vertical', pad=0.02, extend=extend)
+        cbar.set_label(label)
+        artists.extend([im, cbar])
+
+        if is_vector:
+            # Strided view setiap 2 titik grid, tanpa salinan array
+            step = slice(None, None, 2)
+            artists.append(ax.quiver(var_lon[step], var_lat[step], u[step, step], v[step, step],
+                                     transform=ccrs.PlateCarree(), scale=700, width=0.002, color='black'))
+
+    # Tampilkan di Streamlit: render PNG sekali, tanpa serialisasi Figure oleh st.pyplot
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=100, bbox_inches="tight",
+                metadata={"Software": None}, pil_kwargs={"optimize": False})
+    buf.seek(0)
+    st.image(buf)